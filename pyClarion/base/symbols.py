@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 from typing import Union, NamedTuple
+from functools import lru_cache
 
 
 __all__ = ["dimension", "feature", "chunk", "rule"]
@@ -20,6 +21,13 @@ class dimension(NamedTuple):
     lag: int = 0
 
 
+# Interns dimension symbols so that repeated requests for the same dimension 
+# return the same object; dict lookups on interned keys succeed on identity. 
+# Typed, so that equal lags of different types (e.g., 1, 1.0, True) are kept 
+# distinct.
+_intern_dim = lru_cache(maxsize=4096, typed=True)(dimension)
+
+
 class feature(NamedTuple):
     """
     A feature symbol.
@@ -36,7 +44,7 @@ class feature(NamedTuple):
     @property
     def dim(self) -> dimension:
         """Feature dimension."""
-        return dimension(self.d, self.l)
+        return _intern_dim(self.d, self.l)
 
 
 class chunk(NamedTuple):
@@ -11,7 +11,7 @@ from .. import dev as cld
 
 import re
 from typing import (OrderedDict, Tuple, Dict, List, TypeVar, Union, Sequence, 
-    Generator)
+    Generator, NamedTuple)
 from functools import partial
 
 
@@ -162,6 +162,7 @@ class CAM(cld.Process):
 
     initial = nd.NumDict()
 
+    @cld.cache_last
     def call(self, *inputs: nd.NumDict[T]) -> nd.NumDict[T]:
         return nd.NumDict.eltwise_cam(*inputs)
 
@@ -278,11 +279,61 @@ class ActionSampler(cld.Process):
         return (feature(cld.prefix("temp", self.prefix)),)
 
 
-class BottomUp(cld.Process):
+class _ChunkLayout(NamedTuple):
+    """
+    Per-chunk view of chunk-feature and chunk-dimension weights.
+    
+    :param row: Top-down weight of each feature of the chunk.
+    :param groups: Chunk features grouped by dimension, each group paired 
+        with its dimension weight.
+    """
+
+    row: nd.NumDict[feature]
+    groups: Tuple[Tuple[float, Tuple[feature, ...]], ...]
+
+
+def _chunk_layouts(
+    fs: nd.NumDict[Tuple[chunk, feature]], 
+    ws: nd.NumDict[Tuple[chunk, dimension]]
+) -> Dict[chunk, _ChunkLayout]:
+    """
+    Return a per-chunk layout of chunk-feature and chunk-dimension weights.
+
+    :param fs: Chunk-feature associations (binary).
+    :param ws: Chunk-dimension associations (i.e., top-down weights).
+    """
+
+    rows: Dict[chunk, Dict[feature, float]] = {}
+    groups: Dict[chunk, List[Tuple[float, Tuple[feature, ...]]]] = {}
+    for (c, dim), cfs in cld.group_by(fs, key=cld.cf2cd).items():
+        w = ws[(c, dim)]
+        groups.setdefault(c, []).append((w, tuple(f for _, f in cfs)))
+        row = rows.setdefault(c, {})
+        if (c, dim) in ws:
+            row.update((f, fs[(c, f)] * w) for _, f in cfs)
+    return {c: _ChunkLayout(nd.NumDict(rows[c]), tuple(gs)) 
+        for c, gs in groups.items()}
+
+
+class _LayoutCache(cld.Process):
+    """Base for processes reading chunk layouts from fs and ws."""
+
+    @cld.cache_last
+    def _layouts(
+        self, 
+        fs: nd.NumDict[Tuple[chunk, feature]], 
+        ws: nd.NumDict[Tuple[chunk, dimension]]
+    ) -> Dict[chunk, _ChunkLayout]:
+        # Recomputed only when fs or ws change.
+        return _chunk_layouts(fs, ws)
+
+
+class BottomUp(_LayoutCache):
     """Propagates bottom-up activations."""
 
     initial = nd.NumDict()
 
+    @cld.cache_last
     def call(
         self, 
         fs: nd.NumDict[Tuple[chunk, feature]], 
@@ -300,20 +351,36 @@ class BottomUp(cld.Process):
         :param d: Feature strengths in the bottom level.
         """
 
-        return (fs
-            .put(d, kf=cld.second, strict=True)
-            .cam_by(kf=cld.cf2cd)
-            .mul_from(ws, kf=cld.eye)
-            .sum_by(kf=cld.first)
-            .squeeze()
-            .div_from(wn, kf=cld.eye, strict=True))
-
-
-class TopDown(cld.Process):
+        # Single fused pass: for each chunk, take the cam of present feature 
+        # strengths in each dimension and accumulate their weighted sum. 
+        # Strengths are read from a plain dict snapshot of d; dict.get returns 
+        # None for absent features.
+        get = d.m.get
+        strengths = {}
+        for c, layout in self._layouts(fs, ws).items():
+            s = 0.0
+            for w, fs_d in layout.groups:
+                hi = lo = 0.0
+                found = False
+                for f in fs_d:
+                    v = get(f)
+                    if v is not None:
+                        found = True
+                        if v > hi: hi = v
+                        elif v < lo: lo = v
+                if found: 
+                    s += w * (hi + lo)
+            if s != 0.0 and c in wn:
+                strengths[c] = s / wn[c]
+        return nd.NumDict(strengths)
+
+
+class TopDown(_LayoutCache):
     """Propagates top-down activations."""
 
     initial = nd.NumDict()
 
+    @cld.cache_last
     def call(
         self, 
         fs: nd.NumDict[Tuple[chunk, feature]], 
@@ -328,11 +395,12 @@ class TopDown(cld.Process):
         :param d: Chunk strengths in the top level.
         """
 
-        return (fs
-            .mul_from(d, kf=cld.first, strict=True)
-            .mul_from(ws, kf=cld.cf2cd, strict=True)
-            .cam_by(kf=cld.second) 
-            .squeeze())
+        layouts = self._layouts(fs, ws)
+        scaled = [layouts[c].row * s for c, s in d.items() 
+            if c in layouts and len(layouts[c].row)]
+        if not scaled:
+            return nd.NumDict()
+        return nd.NumDict.eltwise_cam(*scaled).squeeze()
 
 
 class AssociativeRules(cld.Process):
@@ -340,6 +408,7 @@ class AssociativeRules(cld.Process):
 
     initial = (nd.NumDict(), nd.NumDict())
 
+    @cld.cache_last
     def call(
         self, 
         cr: nd.NumDict[Tuple[chunk, rule]], 
@@ -355,12 +424,8 @@ class AssociativeRules(cld.Process):
         :param d: Condition chunk strengths.
         """
 
-        norm = (cr
-            .put(cr.abs().sum_by(kf=cld.first), kf=cld.first)
-            .set_c(1))
-        s_r = (cr
+        s_r = (self._weights(cr)
             .mul_from(d, kf=cld.first, strict=True)
-            .div(norm)
             .sum_by(kf=cld.second)
             .squeeze())
         s_c = (rc
@@ -370,6 +435,16 @@ class AssociativeRules(cld.Process):
 
         return s_c, s_r
 
+    @cld.cache_last
+    def _weights(
+        self, cr: nd.NumDict[Tuple[chunk, rule]]
+    ) -> nd.NumDict[Tuple[chunk, rule]]:
+        # Normalized condition weights; recomputed only when cr changes.
+        norm = (cr
+            .put(cr.abs().sum_by(kf=cld.first), kf=cld.first)
+            .set_c(1))
+        return cr.div(norm)
+
 
 class ActionRules(cld.Process):
     """Selects action chunks according to action rules."""
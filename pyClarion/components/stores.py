@@ -2,7 +2,7 @@
 
 
 from __future__ import annotations
-from typing import (OrderedDict, Tuple, Any, Dict, List, Generic, TypeVar, 
+from typing import (OrderedDict, Tuple, Dict, List, Generic, TypeVar, 
     Container, Optional, Callable)
 from itertools import count
 
@@ -18,13 +18,20 @@ T = TypeVar("T")
 
 
 class BLATracker(Generic[T]):
-    """BLA tracker for top level stores."""
+    """
+    BLA tracker for top level stores.
+    
+    Invocation times are kept in a ring buffer of size max(depth, 1) for each 
+    item, so updates only touch invoked items and older invocations are 
+    overwritten in place.
+    """
 
     params = ("th", "bln", "amp", "dec")
 
-    lags: nd.NumDict[Tuple[T, int]]
+    t: int
+    stamps: nd.NumDict[Tuple[T, int]]
     uses: nd.NumDict[T]
-    lifetimes: nd.NumDict[T]
+    births: nd.NumDict[T]
 
     def __init__(self, depth: int = 1) -> None:
         """
@@ -37,9 +44,26 @@ class BLATracker(Generic[T]):
             raise ValueError("Depth must be non-negative.")
         self.depth = depth
 
-        self.lags = nd.NumDict()
+        self.t = 0
+        self.stamps = nd.NumDict()
         self.uses = nd.NumDict()
-        self.lifetimes = nd.NumDict()
+        self.births = nd.NumDict()
+
+    @property
+    def lags(self) -> nd.NumDict[Tuple[T, int]]:
+        """
+        Steps elapsed since each tracked invocation (1 if just invoked).
+        
+        Keys are (item, slot) pairs, where slot is a position in the item's 
+        ring buffer. Slots do not encode recency (i.e., slot 0 is not 
+        necessarily the most recent invocation).
+        """
+        return (self.t + 1 - self.stamps).set_c(0)
+
+    @property
+    def lifetimes(self) -> nd.NumDict[T]:
+        """Steps elapsed since each item was first seen (1 if just seen)."""
+        return (self.t + 1 - self.births).set_c(0)
 
     def call(self, p: nd.NumDict[str]) -> nd.NumDict:
 
@@ -47,18 +71,27 @@ class BLATracker(Generic[T]):
         amp = p.isolate(key=self.params[2])
         dec = p.isolate(key=self.params[3])
 
+        # Single pass over tracked invocations, collecting for each item the 
+        # sum of lag ** -dec and the oldest tracked lag.
+        now, neg_dec = self.t + 1, -dec.c
+        sums: Dict[T, float] = {}
+        oldest: Dict[T, float] = {}
+        for (x, _), stamp in self.stamps.items():
+            lag = now - stamp
+            sums[x] = sums.get(x, 0.0) + lag ** neg_dec
+            if lag > oldest.get(x, 0.0): 
+                oldest[x] = lag
+
         selector = self.uses > self.depth
-        selector_lags = self.lags.put(selector, kf=cld.first)
         n = self.uses.keep_if(cond=selector)
         t_n = self.lifetimes.keep_if(cond=selector)
-        t_k = self.lags.keep_if(cond=selector_lags).max_by(kf=self.xi2x)
+        t_k = nd.NumDict(oldest).keep_if(cond=selector)
         dec_rs_1 = (1 - dec)
         factor = (n - self.depth).set_c(0) / dec_rs_1
         t = (t_n ** dec_rs_1 - t_k ** dec_rs_1) / (t_n - t_k).set_c(1)
         distant_approx = factor * t
 
-        dec_lags = self.lags.put(dec, kf=cld.first)
-        sum_t = (self.lags ** -dec_lags).sum_by(kf=self.xi2x) + distant_approx
+        sum_t = nd.NumDict(sums) + distant_approx
 
         return bln + amp * sum_t
 
@@ -67,41 +100,22 @@ class BLATracker(Generic[T]):
         th = p.isolate(key=self.params[0])
         invoked = (d > th).squeeze()
 
+        self.t += 1
         self.uses += invoked
-        self.lifetimes += (
-            self.lifetimes
-            .add((d > th).mul(0)) # ensures new items added to lifetimes
-            .mask()) 
-
-        invoked_lags = self.lags.put(invoked, kf=cld.first)
-        unshifted = self.lags.keep_if(cond=invoked_lags.rsub(1))
-        self.lags = (self.lags
-            .keep_if(invoked_lags) # select entries w/ new invocations
-            .transform_keys(kf=self.shift) 
-            .drop(sf=self.expired) # drop entries beyond depth limit
-            .merge(unshifted) # merge in unshifted entries
-            .add(1) # update existing lags
-            .merge(invoked.transform_keys(kf=self.x2xi)))
+        self.births = self.births.merge(d # ensures new items are added
+            .drop(sf=self.births.__contains__)
+            .mask()
+            .mul(self.t))
+
+        # Write invocation times to ring buffer slots, overwriting the oldest
+        size = max(self.depth, 1)
+        self.stamps.update({(x, int(self.uses[x] - 1) % size): self.t 
+            for x in invoked})
 
     def drop(self, d: Container[T]) -> None:
         self.uses = self.uses.drop(sf=d.__contains__)
-        self.lifetimes = self.lifetimes.drop(sf=d.__contains__)
-        self.lags = self.lags.drop(sf=lambda k: k[0] in d)
-
-    def expired(self, key: Tuple[Any, int]) -> bool:
-        return key[1] >= self.depth
-
-    @staticmethod    
-    def shift(key: Tuple[T, int]) -> Tuple[T, int]:
-        return (key[0], key[1] + 1)
-    
-    @staticmethod
-    def xi2x(key: Tuple[T, int]) -> T:
-        return key[0]
-
-    @staticmethod
-    def x2xi(key: T) -> Tuple[T, int]:
-        return (key, 0)
+        self.births = self.births.drop(sf=d.__contains__)
+        self.stamps = self.stamps.drop(sf=lambda k: k[0] in d)
 
 
 class Store(Process):
@@ -156,9 +170,19 @@ class Store(Process):
         nd.NumDict[rule]]:
 
         cb, rb = self.update_blas(p, c, r)
-        wn = self.g(self.wn).set_c(0)
+        self.wn.prot = True # like other store data, protected once emitted
+        wn = self._normalize(self.wn, self.g)
         return self.cf, self.cw, wn, self.cr, self.rc, cb, rb
 
+    @cld.cache_last
+    def _normalize(
+        self, 
+        wn: nd.NumDict[chunk], 
+        g: Callable[[nd.NumDict[chunk]], nd.NumDict[chunk]]
+    ) -> nd.NumDict[chunk]:
+        # Apply g to chunk weight sums; recomputed only when wn or g change.
+        return g(wn).set_c(0)
+
     def update_blas(
         self, p: nd.NumDict[feature], c: nd.NumDict[chunk], r: nd.NumDict[rule]
     ) -> Tuple[nd.NumDict[chunk], nd.NumDict[rule]]:
@@ -5,15 +5,18 @@ from .base import feature, dimension, chunk, Process
 from .base.uris import (FSEP, SEP, SUP, ID, ispath, join, split, split_head, 
     commonprefix, remove_prefix, relativize, prefix)
 from typing import overload, Dict, Any, Tuple, Iterable, Callable, TypeVar, List
-from .numdicts import GradientTape
+from functools import wraps
+from .numdicts import GradientTape, NumDict
 
 
 __all__ = ["FSEP", "SEP", "SUP", "ID", "Process", "GradientTape", "lag", 
-    "first", "second", "group_by", "group_by_dims", "ispath", "join", "split", 
-    "split_head", "commonprefix", "remove_prefix", "relativize", "prefix"]
+    "first", "second", "group_by", "group_by_dims", "cache_last", "ispath", 
+    "join", "split", "split_head", "commonprefix", "remove_prefix", 
+    "relativize", "prefix"]
 
 
 T = TypeVar("T")
+C = TypeVar("C", bound=Callable)
 
 
 def eye(x: T) -> T:
@@ -75,3 +78,39 @@ def group_by_dims(
     :param features: An iterable of features to be grouped by dimension.
     """
     return group_by(iterable=features, key=feature.dim.fget)
+
+
+def cache_last(f: C) -> C:
+    """
+    Cache the last result of a method taking NumDict arguments.
+
+    The cached result is reused so long as the method is called again with the 
+    very same NumDict objects and all of them are protected. Protected NumDicts 
+    cannot be mutated in place, so their identity fixes their contents. Results 
+    are only cached if every NumDict argument is already protected. Other 
+    arguments (e.g., functions) are matched by identity alone. The cache is 
+    bypassed for keyword arguments and while a GradientTape is recording, so 
+    that taped ops are always registered.
+
+    Intended for precomputing data that depend only on slowly changing inputs 
+    (e.g., chunk and rule weights emitted by a store), or for skipping pure 
+    process calls whose inputs did not change.
+    """
+
+    attr = f"_cache_{f.__name__}"
+
+    @wraps(f)
+    def wrapper(self, *args, **kwargs):
+        if kwargs or GradientTape.TAPE.get(None) is not None:
+            return f(self, *args, **kwargs)
+        cargs, result = getattr(self, attr, ((), None))
+        if (args and len(args) == len(cargs) 
+            and all(a is b and (not isinstance(a, NumDict) or a.prot) 
+                for a, b in zip(args, cargs))):
+            return result
+        result = f(self, *args)
+        if all(a.prot for a in args if isinstance(a, NumDict)):
+            setattr(self, attr, (args, result))
+        return result
+
+    return wrapper # type: ignore
@@ -154,7 +154,7 @@ def transform_keys(
     :param d: The NumDict to be transformed.
     :param kf: A function taking keys of d to a new keys space.
     """
-    new = nd.NumDict._new(m={kf(k): d[k] for k in d}, c=d._c)
+    new = nd.NumDict._new(m={kf(k): v for k, v in d.items()}, c=d._c)
     if len(d) != len(new):
         raise ValueError("Function must be one-to-one on keys of arg d.")
     return new
@@ -260,15 +260,14 @@ class GradientTape:
         def wrapper(f: Callable[P, nd.NumDict]) -> Callable[P, nd.NumDict]:
 
             name = f.__qualname__
+            TAPE = cls.TAPE
 
             @wraps(f)
             def op_wrapper(*args: P.args, **kwargs: P.kwargs) -> nd.NumDict:
                 d = f(*args, **kwargs)
-                try: 
-                    tape = cls.TAPE.get()
-                except LookupError: 
-                    pass
-                else: 
+                # Default avoids raising LookupError on every untaped op call
+                tape = TAPE.get(None)
+                if tape is not None: 
                     tape._register(d, name, args, kwargs)
                 return d
 
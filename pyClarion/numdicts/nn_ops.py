@@ -11,9 +11,12 @@ from .utils import sigmoid as _sigmoid
 from .utils import tanh as _tanh
 
 from math import exp as _exp
+from math import inf
 
-from typing import Tuple, Callable, Iterable, TypeVar, cast
-from random import choices
+from typing import Tuple, Callable, Iterable, TypeVar
+from itertools import accumulate, islice
+from bisect import bisect
+from random import random
 
 
 __all__ = ["sigmoid", "tanh", "boltzmann", "sample", "cam_by", "eltwise_cam"]
@@ -52,14 +55,13 @@ def boltzmann(d: nd.NumDict, t: nd.NumDict) -> nd.NumDict:
         raise ValueError("Arg d should not be empty.")
     if len(t):
         raise ValueError("Temperature should be a scalar.")
-    ks, vs = zip(*d.items())
-    vmax, _t = max(vs), t._c
-    # v - vmax is a stability trick; softmax(x) = softmax(x + c)
-    exp_v = [_exp((v - vmax) / _t) for v in vs]
-    assert len(exp_v)
-    sum_exp_v = sum(exp_v)
-    vals = [v / sum_exp_v for v in exp_v]
-    return nd.NumDict._new(m={k: v for k, v in zip(ks, vals)})
+    vs, inv_t = d._m.values(), 1.0 / t._c
+    # Shifting by vref is a stability trick; softmax(x) = softmax(x + c). vref 
+    # is chosen so that the largest exponent is 0 regardless of the sign of t.
+    vref = max(vs) if inv_t > 0 else min(vs)
+    exp_v = [_exp((v - vref) * inv_t) for v in vs]
+    inv_z = 1.0 / sum(exp_v)
+    return nd.NumDict._new(m=dict(zip(d._m, [v * inv_z for v in exp_v])))
 
 @gt.GradientTape.grad(boltzmann)
 def _grad_boltzmann(
@@ -73,9 +75,15 @@ def sample(d: nd.NumDict) -> nd.NumDict:
     """Sample a key from d according to its strength."""
     if not len(d):
         raise ValueError("NumDict must be non-empty.")
-    cs, ws = tuple(zip(*d.items()))
-    s = choices(cs, weights=cast(Tuple[float], ws))
-    return nd.NumDict._new(m={k: 1.0 if k in s else 0.0 for k in d})
+    # Inverse CDF sampling; equivalent to random.choices() w/o its overhead
+    cdf = list(accumulate(d._m.values()))
+    total = cdf[-1]
+    if not 0.0 < total < inf:
+        raise ValueError("Total strength must be positive and finite.")
+    i = bisect(cdf, random() * total, 0, len(cdf) - 1)
+    m = dict.fromkeys(d._m, 0.0)
+    m[next(islice(d._m, i, None))] = 1.0
+    return nd.NumDict._new(m=m)
 
 @gt.GradientTape.grad(sample)
 def _grad_sample(
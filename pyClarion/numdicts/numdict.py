@@ -8,7 +8,8 @@ from . import dict_ops as dops
 from . import vec_ops as vops
 from . import nn_ops
 
-from typing import Callable, Dict, Mapping, TypeVar, Iterator, Any, Optional
+from typing import (Callable, Dict, Mapping, TypeVar, Iterator, Any, Optional, 
+    KeysView, ValuesView, ItemsView)
 from typing_extensions import Concatenate, ParamSpec
 from functools import wraps
 from math import isnan, isinf
@@ -117,16 +118,25 @@ class NumDict(Mapping[T, float]):
         return len(self._m)
 
     def __iter__(self) -> Iterator[T]:
-        yield from iter(self._m)
+        return iter(self._m)
 
     def __contains__(self, key: Any) -> bool:
         return key in self._m
 
     def __getitem__(self, key: Any) -> float:
-        try:
-            return self._m[key] # type: ignore
-        except KeyError:
-            return self._c
+        return self._m.get(key, self._c)
+
+    # Views of the underlying dict; these iterate natively, bypassing the 
+    # per-item __getitem__ calls of the generic Mapping views.
+
+    def keys(self) -> KeysView[T]:
+        return self._m.keys()
+
+    def values(self) -> ValuesView[float]:
+        return self._m.values()
+
+    def items(self) -> ItemsView[T, float]:
+        return self._m.items()
 
     @inplace
     def __setitem__(self, key: Any, val: float | int | bool) -> None:
@@ -35,10 +35,22 @@ def op1(f: Callable[[float], float], d: nd.NumDict[T]) -> nd.NumDict[T]:
 def op2(
     f: Callable[[float, float], float], d1: nd.NumDict[T], d2: nd.NumDict[T]
 ) -> nd.NumDict[T]:
+    # Broadcast constant operands directly, avoiding key unions and lookups
+    if not len(d2):
+        c2 = d2._c
+        return nd.NumDict._new(
+            m={k: f(v, c2) for k, v in d1.items()}, 
+            c=f(d1._c, c2))
+    if not len(d1):
+        c1 = d1._c
+        return nd.NumDict._new(
+            m={k: f(c1, v) for k, v in d2.items()}, 
+            c=f(c1, d2._c))
     keys = set(d1) | set(d2)
+    get1, c1, get2, c2 = d1._m.get, d1._c, d2._m.get, d2._c
     return nd.NumDict._new(
-        m={k: f(d1[k], d2[k]) for k in keys}, 
-        c=f(d1.c, d2.c))
+        m={k: f(get1(k, c1), get2(k, c2)) for k in keys}, 
+        c=f(c1, c2))
 
 
 ### ABSTRACT AGGREGATION FUNCTIONS ###
@@ -73,10 +85,17 @@ def eltwise(
     *ds: nd.NumDict[T], f: Callable[[Iterable[float]], float]
 ) -> nd.NumDict[T]:
     if len(ds) < 1: raise ValueError("At least one input is necessary.")
+    if len(ds) == 1:
+        d, = ds
+        return nd.NumDict._new(
+            m={k: f([v]) for k, v in d._m.items()}, 
+            c=f([d._c]))
     ks: Set[T] = set(); ks = ks.union(*ds)
+    # Bound dict.get calls fall back on constants w/o raising on missing keys 
+    gets = [(d._m.get, d._c) for d in ds]
     return nd.NumDict._new(
-        m={k: f([d[k] for d in ds]) for k in ks}, 
-        c=f([d.c for d in ds]))
+        m={k: f([get(k, c) for get, c in gets]) for k in ks}, 
+        c=f([c for _, c in gets]))
 
 
 # ARITHMETIC HELPER FUNCTIONS #
@@ -0,0 +1,94 @@
+import unittest
+
+from pyClarion import dev as cld
+from pyClarion import numdicts as nd
+from pyClarion.base import chunk, feature
+from pyClarion.components import TopDown, Store
+
+
+class Counter:
+
+    def __init__(self):
+        self.calls = 0
+
+    @cld.cache_last
+    def f(self, *ds):
+        self.calls += 1
+        return nd.NumDict().merge(*ds)
+
+
+class CacheLastTestCase(unittest.TestCase):
+
+    def test_hit_on_same_protected_inputs(self):
+        obj = Counter()
+        d1, d2 = nd.NumDict({1: 1.0}, prot=True), nd.NumDict({2: 2.0}, prot=True)
+        r1 = obj.f(d1, d2)
+        r2 = obj.f(d1, d2)
+        self.assertIs(r1, r2)
+        self.assertEqual(obj.calls, 1)
+
+    def test_miss_on_unprotected_inputs(self):
+        obj = Counter()
+        d = nd.NumDict({1: 1.0})
+        obj.f(d)
+        d[1] = 3.0
+        self.assertEqual(obj.f(d)[1], 3.0)
+        self.assertEqual(obj.calls, 2)
+
+    def test_miss_on_inputs_protected_after_mutation(self):
+        obj = Counter()
+        d = nd.NumDict({1: 1.0})
+        obj.f(d)
+        d[1] = 5.0
+        d.prot = True
+        self.assertEqual(obj.f(d)[1], 5.0)
+        self.assertEqual(obj.calls, 2)
+
+    def test_miss_on_replaced_inputs(self):
+        obj = Counter()
+        d1 = nd.NumDict({1: 1.0}, prot=True)
+        d2 = nd.NumDict({1: 1.0}, prot=True)
+        obj.f(d1)
+        obj.f(d2)
+        obj.f(d1)
+        self.assertEqual(obj.calls, 3)
+
+    def test_bypass_while_taping(self):
+        obj = Counter()
+        d = nd.NumDict({1: 1.0}, prot=True)
+        obj.f(d)
+        with nd.GradientTape():
+            obj.f(d)
+        self.assertEqual(obj.calls, 2)
+        obj.f(d)
+        self.assertEqual(obj.calls, 2)
+
+
+class ProcessCachingTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.c, self.f = chunk("c"), feature("d", "v")
+        self.fs = nd.NumDict({(self.c, self.f): 1.0}, prot=True)
+        self.ws = nd.NumDict({(self.c, self.f.dim): 2.0}, prot=True)
+
+    def test_top_down_tracks_store_replacement(self):
+        td = TopDown()
+        s = nd.NumDict({self.c: 1.0}, prot=True)
+        self.assertEqual(td.call(self.fs, self.ws, s)[self.f], 2.0)
+        ws = nd.NumDict({(self.c, self.f.dim): 3.0}, prot=True)
+        self.assertEqual(td.call(self.fs, ws, s)[self.f], 3.0)
+
+    def test_store_tracks_wn_and_g(self):
+        store = Store()
+        store.wn = nd.NumDict({self.c: 2.0})
+        p = nd.NumDict()
+        empty = nd.NumDict()
+        self.assertEqual(store.call(p, empty, empty, empty)[2][self.c], 2.0)
+        store.g = lambda d: d * 10
+        self.assertEqual(store.call(p, empty, empty, empty)[2][self.c], 20.0)
+        store.wn = nd.NumDict({self.c: 3.0})
+        self.assertEqual(store.call(p, empty, empty, empty)[2][self.c], 30.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
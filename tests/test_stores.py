@@ -0,0 +1,67 @@
+import unittest
+import random
+
+from pyClarion import numdicts as nd
+from pyClarion.components.stores import BLATracker
+
+
+def reference_blas(history, first_seen, t, depth, bln, amp, dec):
+    # BLAs computed from scratch from full invocation histories. The most 
+    # recent max(depth, 1) invocations of each item are summed exactly; older 
+    # ones are approximated from the item's lifetime when uses > depth.
+    result = {}
+    for x, ts in history.items():
+        if not ts: 
+            continue
+        recent = ts[-max(depth, 1):]
+        lags = [t - s + 1 for s in recent]
+        total = sum(lag ** -dec for lag in lags)
+        n = len(ts)
+        if n > depth:
+            t_n, t_k = t - first_seen[x] + 1, max(lags)
+            total += ((n - depth) / (1 - dec) 
+                * (t_n ** (1 - dec) - t_k ** (1 - dec)) / (t_n - t_k))
+        result[x] = bln + amp * total
+    return result
+
+
+class BLATrackerTestCase(unittest.TestCase):
+
+    def test_matches_reference_on_random_trace(self):
+        p = nd.NumDict({"th": 0.5, "bln": 0.1, "amp": 2.0, "dec": 0.5})
+        for depth in (1, 2, 4):
+            with self.subTest(depth=depth):
+                rng = random.Random(1)
+                tracker = BLATracker(depth)
+                history, first_seen = {}, {}
+                for t in range(1, 61):
+                    d = nd.NumDict({k: rng.random() for k in "abcdefg" 
+                        if rng.random() < 0.6})
+                    tracker.update(p, d)
+                    for x, v in d.items():
+                        first_seen.setdefault(x, t)
+                        if v > p["th"]: 
+                            history.setdefault(x, []).append(t)
+                    if t % 7 == 4:
+                        tracker.drop({"c"})
+                        history.pop("c", None)
+                        first_seen.pop("c", None)
+                    expected = reference_blas(history, first_seen, t, depth, 
+                        p["bln"], p["amp"], p["dec"])
+                    actual = tracker.call(p)
+                    self.assertEqual(set(actual), set(expected))
+                    for x, v in expected.items():
+                        self.assertAlmostEqual(actual[x], v, places=9)
+
+    def test_lags_are_bounded_by_depth(self):
+        p = nd.NumDict({"th": 0.5, "bln": 0.0, "amp": 1.0, "dec": 0.5})
+        tracker = BLATracker(3)
+        for _ in range(10):
+            tracker.update(p, nd.NumDict({"a": 1.0}))
+        self.assertEqual(sorted(tracker.lags.values()), [1.0, 2.0, 3.0])
+        self.assertEqual(tracker.lifetimes["a"], 10.0)
+        self.assertEqual(tracker.uses["a"], 10.0)
+
+
+if __name__ == "__main__":
+    unittest.main()